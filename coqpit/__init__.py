@@ -1 +1 @@
-from coqpit.coqpit import MISSING, Coqpit, check_argument, dataclass
+from coqpit.coqpit import MISSING, Coqpit, add_slots, check_argument, check_arguments, dataclass
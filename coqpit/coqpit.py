@@ -1,14 +1,35 @@
 import argparse
 import functools
+import inspect
 import json
-import operator
 import os
 from collections.abc import MutableMapping
 from dataclasses import MISSING as _MISSING
-from dataclasses import Field, asdict, dataclass, fields, is_dataclass, replace
+from dataclasses import Field, dataclass, fields, is_dataclass, replace
 from pathlib import Path
 from pprint import pprint
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union, get_type_hints
+from types import FunctionType, MappingProxyType
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_type_hints,
+)
+
+try:
+    import orjson  # pylint: disable=import-error
+except ImportError:
+    orjson = None
 
 T = TypeVar("T")
 MISSING: Any = "???"
@@ -22,6 +43,13 @@ NoDefaultVar = Union[_NoDefault[T], T]
 no_default: NoDefaultVar = _NoDefault()
 
 
+# field types that are (de)serialized as they are
+_PRIMITIVE_TYPES = (int, float, str, bool)
+
+# types that are already json serializable and returned by `_serialize()` as they are
+_PASSTHROUGH = frozenset({int, float, str, bool, type(None)})
+
+
 def is_primitive_type(arg_type: Any) -> bool:
     """Check if the input type is one of `int, float, str, bool`.
 
@@ -31,10 +59,7 @@ def is_primitive_type(arg_type: Any) -> bool:
     Returns:
         bool: True if input type is one of `int, float, str, bool`.
     """
-    try:
-        return isinstance(arg_type(), (int, float, str, bool))
-    except (AttributeError, TypeError):
-        return False
+    return arg_type in _PRIMITIVE_TYPES
 
 
 def is_list(arg_type: Any) -> bool:
@@ -46,10 +71,7 @@ def is_list(arg_type: Any) -> bool:
     Returns:
         bool: True if input type is `list`
     """
-    try:
-        return arg_type is list or arg_type is List or arg_type.__origin__ is list or arg_type.__origin__ is List
-    except AttributeError:
-        return False
+    return arg_type is list or arg_type is List or getattr(arg_type, "__origin__", None) in (list, List)
 
 
 def is_dict(arg_type: Any) -> bool:
@@ -61,10 +83,7 @@ def is_dict(arg_type: Any) -> bool:
     Returns:
         bool: True if input type is `dict`
     """
-    try:
-        return arg_type is dict or arg_type is Dict or arg_type.__origin__ is dict
-    except AttributeError:
-        return False
+    return arg_type is dict or arg_type is Dict or getattr(arg_type, "__origin__", None) is dict
 
 
 def is_union(arg_type: Any) -> bool:
@@ -76,10 +95,7 @@ def is_union(arg_type: Any) -> bool:
     Returns:
         bool: True if input type is `Union`
     """
-    try:
-        return safe_issubclass(arg_type.__origin__, Union)
-    except AttributeError:
-        return False
+    return getattr(arg_type, "__origin__", None) is Union
 
 
 def safe_issubclass(cls, classinfo) -> bool:
@@ -103,36 +119,268 @@ def safe_issubclass(cls, classinfo) -> bool:
 def _coqpit_json_default(obj: Any) -> Any:
     if isinstance(obj, Path):
         return str(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        # expand the nested dataclasses only when the encoder reaches them, no copy of the whole tree is built
+        return {name: getattr(obj, name) for name in _object_field_names(obj)}
     raise TypeError(f"Can't encode object of type {type(obj).__name__}")
 
 
-def _default_value(x: Field):
-    """Return the default value of the input Field.
+def _json_loads(input_str: str) -> Any:
+    """Parse a json string. Uses `orjson` when it is installed and falls back to `json` otherwise.
+
+    `orjson` does not accept `Infinity` and `NaN` that `json` writes for non-finite floats, so the input is
+    parsed again by `json` if `orjson` rejects it.
+
+    Args:
+        input_str (str): json string.
+
+    Returns:
+        Any: parsed object.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(input_str)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(input_str)
+
+
+def _is_optional_type(field_type: Any) -> bool:
+    """Check if the input field type is optional.
 
     Args:
-        x (Field): input Field.
+        field_type (Any): resolved field type to check.
 
     Returns:
-        object: default value of the input Field.
+        bool: True if the input field type is optional.
     """
-    if x.default not in (MISSING, _MISSING):
-        return x.default
-    if x.default_factory not in (MISSING, _MISSING):
-        return x.default_factory()
-    return x.default
+    return type(None) in getattr(field_type, "__args__", ())
 
 
-def _is_optional_field(field) -> bool:
-    """Check if the input field is optional.
+# class attribute holding the results of the `_class_cache` functions of a class
+_CLASS_CACHE_ATTR = "__coqpit_cache__"
+
+
+def _class_cache(func: Callable[[type], Any]) -> Callable[[type], Any]:
+    """Cache the result of a function of a class on the class itself, so it is computed once per class and released
+    with the class (e.g. configs created at runtime).
+
+    Args:
+        func (Callable[[type], Any]): function taking a class as its only argument.
+
+    Returns:
+        Callable[[type], Any]: cached function.
+    """
+
+    @functools.wraps(func)
+    def wrapper(cls):
+        # look at the class `__dict__` only, subclasses have their own fields and need their own cache
+        cache = cls.__dict__.get(_CLASS_CACHE_ATTR, None)
+        if cache is None:
+            cache = {}
+            setattr(cls, _CLASS_CACHE_ATTR, cache)
+        try:
+            return cache[func.__name__]
+        except KeyError:
+            result = cache[func.__name__] = func(cls)
+            return result
+
+    return wrapper
+
+
+@_class_cache
+def _cached_fields(cls) -> Tuple[Field, ...]:
+    """Return the dataclass fields of the input class. Computed once per class.
+
+    Args:
+        cls (type): dataclass type.
+
+    Returns:
+        Tuple[Field, ...]: fields of the dataclass.
+    """
+    return fields(cls)
+
+
+@_class_cache
+def _cached_field_names(cls) -> FrozenSet[str]:
+    """Return the set of dataclass field names of the input class. Computed once per class.
 
     Args:
-        field (Field): input Field to check.
+        cls (type): dataclass type.
 
     Returns:
-        bool: True if the input field is optional.
+        FrozenSet[str]: field names of the dataclass.
     """
-    # return isinstance(field.type, _GenericAlias) and type(None) in getattr(field.type, "__args__")
-    return type(None) in getattr(field.type, "__args__")
+    return frozenset(f.name for f in _cached_fields(cls))
+
+
+@_class_cache
+def _ordered_field_names(cls) -> Tuple[str, ...]:
+    """Return the dataclass field names of the input class in definition order. Computed once per class.
+
+    Args:
+        cls (type): dataclass type.
+
+    Returns:
+        Tuple[str, ...]: field names of the dataclass.
+    """
+    return tuple(f.name for f in _cached_fields(cls))
+
+
+@_class_cache
+def _field_contracts(cls) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, Callable[[Any], bool]], ...]]:
+    """Return the names of the non-optional dataclass fields of the input class and the contracts of the fields that
+    define one. Computed once per class so that `_validate_contracts()` only visits the fields it needs to check.
+
+    Args:
+        cls (type): dataclass type.
+
+    Returns:
+        Tuple[Tuple[str, ...], Tuple[Tuple[str, Callable[[Any], bool]], ...]]: non-optional field names and
+        `(name, contract)` pairs.
+    """
+    cls_fields = _cached_fields(cls)
+    # resolved types, `Field.type` is a string under `from __future__ import annotations`
+    field_types = _field_types(cls)
+    required = tuple(f.name for f in cls_fields if not _is_optional_type(field_types[f.name]))
+    contracts = tuple(
+        (f.name, f.metadata["contract"]) for f in cls_fields if f.metadata.get("contract", None) is not None
+    )
+    return required, contracts
+
+
+def _object_field_names(obj: Any) -> Tuple[str, ...]:
+    """Return the cached dataclass field names of the input dataclass or dataclass instance.
+
+    Args:
+        obj (Any): dataclass or dataclass instance.
+
+    Returns:
+        Tuple[str, ...]: field names of the dataclass in definition order.
+    """
+    return _ordered_field_names(obj if isinstance(obj, type) else type(obj))
+
+
+def _clear_field_caches(cls: type) -> None:
+    """Drop the cached field information of the input class and its subclasses. Needed when the fields of a class are
+    changed in place (e.g. by `merge()`).
+
+    Args:
+        cls (type): class whose fields changed.
+    """
+    cache = cls.__dict__.get(_CLASS_CACHE_ATTR, None)
+    if cache is not None:
+        cache.clear()
+    for subclass in cls.__subclasses__():
+        _clear_field_caches(subclass)
+
+
+# slots that do not hold the attributes of a config
+_NON_ATTRIBUTE_SLOTS = ("__dict__", "__weakref__", "_initialized")
+
+
+@_class_cache
+def _cached_slot_names(cls) -> FrozenSet[str]:
+    """Return the names of the `__slots__` attributes defined by the input class and its bases. Computed once per class.
+
+    Args:
+        cls (type): class to get the slot names of.
+
+    Returns:
+        FrozenSet[str]: slot names.
+    """
+    slot_names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        slot_names.extend(name for name in slots if name not in _NON_ATTRIBUTE_SLOTS)
+    return frozenset(slot_names)
+
+
+def _instance_vars(obj: Any) -> Dict[str, Any]:
+    """Return the instance attributes of the input object as `vars()` does, also including the values stored in
+    `__slots__`.
+
+    Args:
+        obj (Any): input object.
+
+    Returns:
+        Dict[str, Any]: attribute values by name. It is the instance `__dict__` itself if the object has no slots.
+    """
+    slot_names = _cached_slot_names(type(obj))
+    if not slot_names:
+        return obj.__dict__
+    attrs = dict(getattr(obj, "__dict__", {}))
+    for name in slot_names:
+        try:
+            attrs[name] = object.__getattribute__(obj, name)
+        except AttributeError:
+            # unset slot
+            pass
+    return attrs
+
+
+def _instance_var(obj: Any, name: str) -> Any:
+    """Return a single instance attribute of the input object as `_instance_vars(obj)[name]` does, without collecting
+    all the slot values of a slotted object.
+
+    Args:
+        obj (Any): input object.
+        name (str): attribute name.
+
+    Raises:
+        KeyError: the object has no instance attribute with the given name.
+
+    Returns:
+        Any: attribute value.
+    """
+    try:
+        if name in _cached_slot_names(type(obj)):
+            return object.__getattribute__(obj, name)
+        return object.__getattribute__(obj, "__dict__")[name]
+    except AttributeError:
+        # unset slot or no `__dict__`
+        raise KeyError(name) from None
+
+
+def _shallow_asdict(obj: Any) -> Any:
+    """Convert dataclass instances in the input to dicts as `dataclasses.asdict` does, but return the leaf values as
+    they are instead of deep copying them. Useful when the output is only read (e.g. dumped to json).
+
+    Args:
+        obj (Any): input object.
+
+    Returns:
+        Any: input object with all the dataclass instances converted to dicts.
+    """
+    # scalars are the most common leaf values and are returned before any of the checks below
+    if type(obj) in _PASSTHROUGH:
+        return obj
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: _shallow_asdict(getattr(obj, f.name)) for f in _cached_fields(type(obj))}
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        # namedtuple
+        return type(obj)(*[_shallow_asdict(v) for v in obj])
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_shallow_asdict(v) for v in obj)
+    if isinstance(obj, dict):
+        return type(obj)((_shallow_asdict(k), _shallow_asdict(v)) for k, v in obj.items())
+    return obj
+
+
+@_class_cache
+def _cached_type_hints(cls) -> Mapping[str, Any]:
+    """Return the type hints of the input class and its bases. Computed once per class.
+
+    Args:
+        cls (type): class to get the type hints of.
+
+    Returns:
+        Mapping[str, Any]: read-only type hints by attribute name.
+    """
+    # `get_type_hints` walks the MRO itself and resolves the annotations of each base in the module of that base
+    return MappingProxyType(get_type_hints(cls))
 
 
 def my_get_type_hints(
@@ -140,20 +388,22 @@ def my_get_type_hints(
 ):
     """Custom `get_type_hints` dealing with https://github.com/python/typing/issues/737
 
+    Args:
+        cls (Union[dataclass, type]): dataclass or dataclass instance to get the type hints of its fields.
+
     Returns:
-        [dataclass]: dataclass to get the type hints of its fields.
+        Dict[str, Any]: type hints by field name.
     """
-    r_dict = {}
-    for base in cls.__class__.__bases__:
-        if base == object:
-            break
-        r_dict.update(my_get_type_hints(base))
-    r_dict.update(get_type_hints(cls))
-    return r_dict
+    if not isinstance(cls, type):
+        cls = type(cls)
+    # copy the cached hints so that the caller can modify the returned dict
+    return dict(_cached_type_hints(cls))
 
 
 def _serialize(x):
     """Pick the right serialization for the datatype of the given input.
+    The implementation is picked by the type of the input and the types without a registered implementation are
+    returned as they are.
 
     Args:
         x (object): input object.
@@ -161,19 +411,72 @@ def _serialize(x):
     Returns:
         object: serialized object.
     """
-    if isinstance(x, Path):
-        return str(x)
-    if isinstance(x, dict):
-        return {k: _serialize(v) for k, v in x.items()}
-    if isinstance(x, list):
-        return [_serialize(xi) for xi in x]
-    if isinstance(x, Serializable) or issubclass(type(x), Serializable):
-        return x.serialize()
-    if isinstance(x, type) and issubclass(x, Serializable):
+    # scalars are the most common values, skip the dispatch for them
+    if type(x) in _PASSTHROUGH:
+        return x
+    return _serialize_dispatch(x)
+
+
+@functools.singledispatch
+def _serialize_dispatch(x):
+    return x
+
+
+@_serialize_dispatch.register(Path)
+def _serialize_path(x):
+    return str(x)
+
+
+@_serialize_dispatch.register(dict)
+def _serialize_dict(x):
+    # the scalar check is inlined to save a function call per leaf value
+    return {k: v if type(v) in _PASSTHROUGH else _serialize_dispatch(v) for k, v in x.items()}
+
+
+@_serialize_dispatch.register(list)
+def _serialize_list(x):
+    return [xi if type(xi) in _PASSTHROUGH else _serialize_dispatch(xi) for xi in x]
+
+
+@_serialize_dispatch.register(type)
+def _serialize_type(x):
+    if getattr(x, "__coqpit_serializable__", False):
         return x.serialize(x)
     return x
 
 
+def _json_round_trip(x: Any) -> Any:
+    """Return the input serialized value as it is loaded back after it is encoded to json, without actually encoding
+    it. The dict keys are converted to `str` and the tuples to lists as `json` does.
+
+    Args:
+        x (Any): serialized value.
+
+    Raises:
+        TypeError: the value or one of its items cannot be encoded to json.
+
+    Returns:
+        Any: value after a json round-trip.
+    """
+    if type(x) in _PASSTHROUGH:
+        return x
+    if isinstance(x, dict):
+        output = {}
+        for k, v in x.items():
+            if not isinstance(k, str):
+                if not isinstance(k, (int, float, bool)) and k is not None:
+                    raise TypeError(f"keys must be str, int, float, bool or None, not {type(k).__name__}")
+                # the same key `json.dumps()` writes
+                k = json.dumps(k)
+            output[k] = _json_round_trip(v)
+        return output
+    if isinstance(x, (list, tuple)):
+        return [_json_round_trip(v) for v in x]
+    if isinstance(x, (str, int, float)):
+        return x
+    raise TypeError(f"Object of type {type(x).__name__} is not JSON serializable")
+
+
 def _deserialize_dict(x: Dict) -> Dict:
     """Deserialize dict.
 
@@ -184,26 +487,30 @@ def _deserialize_dict(x: Dict) -> Dict:
         Dict: deserialized dictionary.
     """
     out_dict = {}
+    decoders = {}  # decoders by value type
     for k, v in x.items():
         if v is None:  # if {'key':None}
             out_dict[k] = None
         else:
-            out_dict[k] = _deserialize(v, type(v))
+            value_type = type(v)
+            decoder = decoders.get(value_type)
+            if decoder is None:
+                decoder = decoders[value_type] = _get_decoder(value_type)
+            out_dict[k] = decoder(v)
     return out_dict
 
 
-def _deserialize_list(x: List, field_type: Type) -> List:
-    """Deserialize values for List typed fields.
+def _list_item_type(field_type: Any) -> Any:
+    """Return the item type of the input `List` type.
 
     Args:
-        x (List): value to be deserialized
-        field_type (Type): field type.
+        field_type (Type): list type.
 
     Raises:
         ValueError: Coqpit does not support multi type-hinted lists.
 
     Returns:
-        [List]: deserialized list.
+        Any: item type or None if the list is not hinted.
     """
     field_args = None
     if hasattr(field_type, "__args__") and field_type.__args__:
@@ -211,34 +518,44 @@ def _deserialize_list(x: List, field_type: Type) -> List:
     elif hasattr(field_type, "__parameters__") and field_type.__parameters__:
         # bandaid for python 3.6
         field_args = field_type.__parameters__
-    if field_args:
-        if len(field_args) > 1:
-            raise ValueError(" [!] Coqpit does not support multi-type hinted 'List'")
-        field_arg = field_args[0]
-        # if field type is TypeVar set the current type by the value's type.
-        if isinstance(field_arg, TypeVar):
-            field_arg = type(x)
-        return [_deserialize(xi, field_arg) for xi in x]
-    return x
+    if not field_args:
+        return None
+    if len(field_args) > 1:
+        raise ValueError(" [!] Coqpit does not support multi-type hinted 'List'")
+    return field_args[0]
 
 
-def _deserialize_union(x: Any, field_type: Type) -> Any:
-    """Deserialize values for Union typed fields
+def _deserialize_list(x: List, field_type: Type, item_decoder: Optional[Callable[[Any], Any]] = None) -> List:
+    """Deserialize values for List typed fields.
 
     Args:
-        x (Any): value to be deserialized.
+        x (List): value to be deserialized
         field_type (Type): field type.
+        item_decoder (Callable[[Any], Any], optional): deserialization function of the list items. Picked by the item
+            type if not given. Defaults to None.
+
+    Raises:
+        ValueError: Coqpit does not support multi type-hinted lists.
 
     Returns:
-        [Any]: desrialized value.
+        [List]: deserialized list.
     """
-    for arg in field_type.__args__:
-        # stop after first matching type in Union
-        try:
-            x = _deserialize(x, arg)
-            break
-        except ValueError:
-            pass
+    field_arg = _list_item_type(field_type)
+    if field_arg is not None:
+        # if field type is TypeVar set the current type by the value's type.
+        if isinstance(field_arg, TypeVar):
+            field_arg = type(x)
+            item_decoder = None
+        if field_arg in _PRIMITIVE_TYPES:
+            # fast path for primitive lists (e.g. `List[float]`) that skips the per element deserialization
+            value_types = set(map(type, x))
+            if value_types <= {field_arg}:
+                return list(x)
+            if field_arg is float and value_types <= {int, float}:
+                return list(map(float, x))
+        if item_decoder is None:
+            item_decoder = _get_decoder(field_arg)
+        return [item_decoder(xi) for xi in x]
     return x
 
 
@@ -254,7 +571,7 @@ def _deserialize_primitive_types(x: Union[int, float, str, bool], field_type: Ty
         Union[int, float, str, bool]: deserialized value.
     """
 
-    if isinstance(x, (str, bool)):
+    if type(x) is field_type or isinstance(x, (str, bool)):
         return x
     if isinstance(x, (int, float)):
         if x == float("inf") or x == float("-inf"):
@@ -266,6 +583,126 @@ def _deserialize_primitive_types(x: Union[int, float, str, bool], field_type: Ty
     return None
 
 
+def _get_type_kind(field_type: Any) -> Optional[str]:
+    """Classify the input field type to pick the right (de)serialization for it.
+
+    Args:
+        field_type (type): field type.
+
+    Returns:
+        Optional[str]: one of `dict, list, union, serializable, primitive` or None if the type is not supported.
+    """
+    if is_dict(field_type):
+        return "dict"
+    if is_list(field_type):
+        return "list"
+    if is_union(field_type):
+        return "union"
+    if isinstance(field_type, type) and getattr(field_type, "__coqpit_serializable__", False):
+        return "serializable"
+    if is_primitive_type(field_type):
+        return "primitive"
+    return None
+
+
+# value types accepted by the decoder of each type kind, used to pick the candidate members of a `Union`
+_VALUE_TYPES_BY_KIND = {
+    "dict": (dict,),
+    "list": (list, tuple),
+    "serializable": (dict,),
+    "primitive": _PRIMITIVE_TYPES,
+}
+
+
+def _get_decoder(field_type: Any) -> Callable[[Any], Any]:
+    """Pick the right deserialization function for the given field type. The decoders of the nested types are bound
+    into the returned function, so it is built once per field by `_field_decoders()`.
+
+    Not cached per type since `typing` compares `Union`s regardless of the order of their arguments, which decides the
+    deserialization of ambiguous values.
+
+    Args:
+        field_type (type): expected type after deserialization.
+
+    Returns:
+        Callable[[Any], Any]: function deserializing a value to `field_type`.
+    """
+    kind = _get_type_kind(field_type)
+    if kind == "dict":
+        return _deserialize_dict
+    if kind == "list":
+        field_arg = _list_item_type(field_type)
+        item_decoder = None if field_arg is None or isinstance(field_arg, TypeVar) else _get_decoder(field_arg)
+        return functools.partial(_deserialize_list, field_type=field_type, item_decoder=item_decoder)
+    if kind == "union":
+        # bind the decoders of the member types once instead of looking them up for each value
+        members = tuple(
+            (_VALUE_TYPES_BY_KIND.get(_get_type_kind(arg), ()), _get_decoder(arg)) for arg in field_type.__args__
+        )
+        decoders_by_value_type = {}
+
+        def _deserialize_union_members(x):
+            value_type = type(x)
+            decoders = decoders_by_value_type.get(value_type)
+            if decoders is None:
+                # only try the members that can take a value of this type, subclasses included (e.g. `OrderedDict`).
+                # Try all of them if none matches (e.g. `numpy` scalars).
+                decoders = tuple(decoder for value_types, decoder in members if issubclass(value_type, value_types))
+                if not decoders:
+                    decoders = tuple(decoder for _, decoder in members)
+                decoders_by_value_type[value_type] = decoders
+            for decoder in decoders:
+                # stop after first matching type in Union
+                try:
+                    return decoder(x)
+                except ValueError:
+                    pass
+            return x
+
+        return _deserialize_union_members
+    if kind == "serializable":
+        return field_type.deserialize_immutable
+    if kind == "primitive":
+        return functools.partial(_deserialize_primitive_types, field_type=field_type)
+
+    def _raise(x):
+        raise ValueError(f" [!] '{type(x)}' value type of '{x}' does not match '{field_type}' field type.")
+
+    return _raise
+
+
+@_class_cache
+def _field_types(cls) -> Dict[str, Any]:
+    """Return the types of the dataclass fields of the input class with the string annotations (e.g. under
+    `from __future__ import annotations`) resolved. Computed once per class.
+
+    Args:
+        cls (type): dataclass type.
+
+    Returns:
+        Dict[str, Any]: field types by field name. Fields with unresolvable annotations keep their `Field.type`.
+    """
+    try:
+        type_hints = _cached_type_hints(cls)
+    except (NameError, TypeError):
+        # annotations referring to names that are not defined in the module of the class
+        type_hints = {}
+    return {f.name: type_hints.get(f.name, f.type) for f in _cached_fields(cls)}
+
+
+@_class_cache
+def _field_decoders(cls) -> Dict[str, Callable[[Any], Any]]:
+    """Return the deserialization function of each field of the input dataclass. Computed once per class.
+
+    Args:
+        cls (type): dataclass type.
+
+    Returns:
+        Dict[str, Callable[[Any], Any]]: deserialization functions by field name.
+    """
+    return {name: _get_decoder(field_type) for name, field_type in _field_types(cls).items()}
+
+
 def _deserialize(x: Any, field_type: Any) -> Any:
     """Pick the right desrialization for the given object and the corresponding field type.
 
@@ -277,113 +714,180 @@ def _deserialize(x: Any, field_type: Any) -> Any:
         object: deserialized object
 
     """
-    # pylint: disable=too-many-return-statements
-    if is_dict(field_type):
-        return _deserialize_dict(x)
-    if is_list(field_type):
-        return _deserialize_list(x, field_type)
-    if is_union(field_type):
-        return _deserialize_union(x, field_type)
-    if issubclass(field_type, Serializable):
-        return field_type.deserialize_immutable(x)
-    if is_primitive_type(field_type):
-        return _deserialize_primitive_types(x, field_type)
-    raise ValueError(f" [!] '{type(x)}' value type of '{x}' does not match '{field_type}' field type.")
+    return _get_decoder(field_type)(x)
 
 
-# Recursive setattr (supports dotted attr names)
-def rsetattr(obj, attr, val):
-    def _setitem(obj, attr, val):
-        return operator.setitem(obj, int(attr), val)
+@_class_cache
+def _fields_without_default(cls) -> Tuple[str, ...]:
+    """Return the names of the fields of the input dataclass that have neither a default value nor a default factory.
+    Computed once per class.
 
-    pre, _, post = attr.rpartition(".")
-    setfunc = _setitem if post.isnumeric() else setattr
+    Args:
+        cls (type): dataclass type.
 
-    return setfunc(rgetattr(obj, pre) if pre else obj, post, val)
+    Returns:
+        Tuple[str, ...]: names of the required fields.
+    """
+    return tuple(f.name for f in _cached_fields(cls) if f.default is _MISSING and f.default_factory is _MISSING)
 
 
-# Recursive getattr (supports dotted attr names)
-def rgetattr(obj, attr, *args):
-    def _getitem(obj, attr):
-        return operator.getitem(obj, int(attr), *args)
+def _deserialize_fields(data: dict, cls: Type) -> dict:
+    """Deserialize the values in the input dictionary that match a field of the given dataclass.
+    Keys that do not match a field are ignored.
+
+    Args:
+        data (dict): serialized field values by field name.
+        cls (type): dataclass type to deserialize the values for.
+
+    Raises:
+        ValueError: if a value is `MISSING`.
+
+    Returns:
+        dict: deserialized field values by field name.
+    """
+    field_decoders = _field_decoders(cls)
+    init_kwargs = {}
+    for name, value in data.items():
+        decoder = field_decoders.get(name)
+        if decoder is None:
+            continue
+        if value is None:
+            init_kwargs[name] = value
+        elif isinstance(value, str) and value == MISSING:
+            raise ValueError(f"Deserialized with unknown value for {name} in {cls.__name__}")
+        else:
+            init_kwargs[name] = decoder(value)
+    return init_kwargs
 
-    def _getattr(obj, attr):
-        getfunc = _getitem if attr.isnumeric() else getattr
-        return getfunc(obj, attr, *args)
 
-    return functools.reduce(_getattr, [obj] + attr.split("."))
+@functools.lru_cache(maxsize=None)
+def _split_path(attr: str) -> Tuple[Union[str, int], ...]:
+    """Split a dotted attribute path (e.g. `model_args.layers.0.size`) into attribute names and list indices.
+    Cached per path since the same argparse keys are resolved over and over.
+
+    Args:
+        attr (str): dotted attribute path.
+
+    Returns:
+        Tuple[Union[str, int], ...]: attribute names and integer list indices.
+    """
+    return tuple(int(name) if name.isdecimal() else name for name in attr.split("."))
+
+
+def _walk_path(obj: Any, names: Tuple[Union[str, int], ...]) -> Any:
+    """Follow the attribute names and list indices returned by `_split_path()` starting from the input object.
+
+    Args:
+        obj (Any): object to start from.
+        names (Tuple[Union[str, int], ...]): attribute names and integer list indices.
+
+    Returns:
+        Any: object at the end of the path.
+    """
+    for name in names:
+        obj = obj[name] if isinstance(name, int) else getattr(obj, name)
+    return obj
+
+
+def _set_path_item(obj: Any, name: Union[str, int], val: Any) -> None:
+    """Set an attribute or a list item of the input object, the last step of a path returned by `_split_path()`.
+
+    Args:
+        obj (Any): object to update.
+        name (Union[str, int]): attribute name or integer list index.
+        val (Any): new value.
+    """
+    if isinstance(name, int):
+        obj[name] = val
+    else:
+        setattr(obj, name, val)
+
+
+# Recursive setattr (supports dotted attr names)
+def rsetattr(obj, attr, val):
+    *names, post = _split_path(attr)
+    _set_path_item(_walk_path(obj, names), post, val)
+
+
+# Recursive getattr (supports dotted attr names)
+def rgetattr(obj, attr, *args):
+    try:
+        return _walk_path(obj, _split_path(attr))
+    except AttributeError:
+        if args:
+            return args[0]
+        raise
 
 
 # Recursive setitem (supports dotted attr names)
 def rsetitem(obj, attr, val):
-    pre, _, post = attr.rpartition(".")
-    return operator.setitem(rgetitem(obj, pre) if pre else obj, post, val)
+    *names, post = _split_path(attr)
+    for name in names:
+        obj = obj[name]
+    obj[post] = val
 
 
 # Recursive getitem (supports dotted attr names)
-def rgetitem(obj, attr, *args):
-    def _getitem(obj, attr):
-        return operator.getitem(obj, int(attr) if attr.isnumeric() else attr, *args)
-
-    return functools.reduce(_getitem, [obj] + attr.split("."))
+def rgetitem(obj, attr):
+    for name in _split_path(attr):
+        obj = obj[name]
+    return obj
 
 
 @dataclass
 class Serializable:
     """Gives serialization ability to any inheriting dataclass."""
 
+    # no instance `__dict__` is forced on the subclasses that define `__slots__` (see `add_slots()`)
+    __slots__ = ()
+    # marks the serializable classes without an `issubclass()` check
+    __coqpit_serializable__ = True
+
     def __post_init__(self):
         self._validate_contracts()
-        for key, value in self.__dict__.items():
+        for key, value in _instance_vars(self).items():
             if value is no_default:
                 raise TypeError(f"__init__ missing 1 required argument: '{key}'")
 
     def _validate_contracts(self):
-        dataclass_fields = fields(self)
-
-        for field in dataclass_fields:
+        required, contracts = _field_contracts(type(self))
 
-            value = getattr(self, field.name)
+        for name in required:
+            if getattr(self, name) is None:
+                raise TypeError(f"{name} is not optional")
 
-            if value is None:
-                if not _is_optional_field(field):
-                    raise TypeError(f"{field.name} is not optional")
-
-            contract = field.metadata.get("contract", None)
-
-            if contract is not None:
-                if value is not None and not contract(value):
-                    raise ValueError(f"break the contract for {field.name}, {self.__class__.__name__}")
+        for name, contract in contracts:
+            value = getattr(self, name)
+            if value is not None and not contract(value):
+                raise ValueError(f"break the contract for {name}, {self.__class__.__name__}")
 
     def validate(self):
         """validate if object can serialize / deserialize correctly."""
         self._validate_contracts()
-        if self != self.__class__.deserialize(  # pylint: disable=no-value-for-parameter
-            json.loads(json.dumps(self.serialize()))
-        ):
+        # convert the serialized values as a json round-trip does, without encoding and parsing a json string
+        serialized = _json_round_trip(self.serialize())
+        if self != self.deserialize_immutable(serialized):
             raise ValueError("could not be deserialized with same value")
 
     def to_dict(self) -> dict:
         """Transform serializable object to dict."""
-        cls_fields = fields(self)
-        o = {}
-        for cls_field in cls_fields:
-            o[cls_field.name] = getattr(self, cls_field.name)
-        return o
+        field_names = _object_field_names(self)
+        return {name: getattr(self, name) for name in field_names}
 
     def serialize(self) -> dict:
         """Serialize object to be json serializable representation."""
         if not is_dataclass(self):
             raise TypeError("need to be decorated as dataclass")
 
-        dataclass_fields = fields(self)
+        field_names = _object_field_names(self)
 
         o = {}
 
-        for field in dataclass_fields:
-            value = getattr(self, field.name)
-            value = _serialize(value)
-            o[field.name] = value
+        for name in field_names:
+            value = getattr(self, name)
+            if type(value) not in _PASSTHROUGH:
+                value = _serialize_dispatch(value)
+            o[name] = value
         return o
 
     def deserialize(self, data: dict) -> "Serializable":
@@ -394,23 +898,12 @@ class Serializable:
         """
         if not isinstance(data, dict):
             raise ValueError()
-        data = data.copy()
-        init_kwargs = {}
-        for field in fields(self):
-            # if field.name == 'dataset_config':
-            if field.name not in data:
-                if field.name in vars(self):
-                    init_kwargs[field.name] = vars(self)[field.name]
-                    continue
-                raise ValueError(f' [!] Missing required field "{field.name}"')
-            value = data.get(field.name, _default_value(field))
-            if value is None:
-                init_kwargs[field.name] = value
-                continue
-            if value == MISSING:
-                raise ValueError(f"deserialized with unknown value for {field.name} in {self.__name__}")
-            value = _deserialize(value, field.type)
-            init_kwargs[field.name] = value
+        # fields missing in `data` keep their current values
+        missing_fields = _cached_field_names(type(self)) - data.keys() - _instance_vars(self).keys()
+        if missing_fields:
+            field_name = next(f.name for f in _cached_fields(type(self)) if f.name in missing_fields)
+            raise ValueError(f' [!] Missing required field "{field_name}"')
+        init_kwargs = _deserialize_fields(data, type(self))
         for k, v in init_kwargs.items():
             setattr(self, k, v)
         return self
@@ -424,31 +917,19 @@ class Serializable:
         """
         if not isinstance(data, dict):
             raise ValueError()
-        data = data.copy()
-        init_kwargs = {}
-        for field in fields(cls):
-            # if field.name == 'dataset_config':
-            if field.name not in data:
-                if field.name in vars(cls):
-                    init_kwargs[field.name] = vars(cls)[field.name]
-                    continue
-                # if not in cls and the default value is not Missing use it
-                default_value = _default_value(field)
-                if default_value not in (MISSING, _MISSING):
-                    init_kwargs[field.name] = default_value
-                    continue
-                raise ValueError(f' [!] Missing required field "{field.name}"')
-            value = data.get(field.name, _default_value(field))
-            if value is None:
-                init_kwargs[field.name] = value
-                continue
-            if value == MISSING:
-                raise ValueError(f"Deserialized with unknown value for {field.name} in {cls.__name__}")
-            value = _deserialize(value, field.type)
-            init_kwargs[field.name] = value
+        # fields missing in `data` are initialized with their default values by `cls.__init__`
+        for field_name in _fields_without_default(cls):
+            if field_name not in data:
+                raise ValueError(f' [!] Missing required field "{field_name}"')
+        init_kwargs = _deserialize_fields(data, cls)
         return cls(**init_kwargs)
 
 
+@_serialize_dispatch.register(Serializable)
+def _serialize_serializable(x):
+    return x.serialize()
+
+
 # ---------------------------------------------------------------------------- #
 #                        Argument Parsing from `argparse`                      #
 # ---------------------------------------------------------------------------- #
@@ -462,6 +943,39 @@ def _get_help(field):
     return field_help
 
 
+def parse_bool(x: str) -> bool:
+    """Parse the command line value of a boolean field.
+
+    Args:
+        x (str): "true" or "false".
+
+    Returns:
+        bool: parsed value.
+    """
+    if x not in ("true", "false"):
+        raise ValueError(f' [!] Value for boolean field must be either "true" or "false". Got "{x}".')
+    return x == "true"
+
+
+@_class_cache
+def _argparse_fields(cls) -> Tuple[Tuple[str, Any, Any, Any, str], ...]:
+    """Return what `init_argparse()` needs to know about each dataclass field of the input class. Computed once per
+    class.
+
+    Args:
+        cls (type): dataclass type.
+
+    Returns:
+        Tuple[Tuple[str, Any, Any, Any, str], ...]: `(name, type, default, default_factory, help)` per field. `default`
+        is None for the fields without a default value.
+    """
+    field_types = _field_types(cls)
+    return tuple(
+        (f.name, field_types[f.name], f.default if f.default is not _MISSING else None, f.default_factory, _get_help(f))
+        for f in _cached_fields(cls)
+    )
+
+
 def _init_argparse(
     parser,
     field_name,
@@ -482,12 +996,13 @@ def _init_argparse(
         has_default = True
         default = field_default_factory()
 
-    if not has_default and not is_primitive_type(field_type) and not is_list(field_type):
+    kind = _get_type_kind(field_type)
+    if not has_default and kind not in ("primitive", "list"):
         # aggregate types (fields with a Coqpit subclass as type) are not supported without None
         return parser
     arg_prefix = field_name if arg_prefix == "" else f"{arg_prefix}.{field_name}"
     help_prefix = field_help if help_prefix == "" else f"{help_prefix} - {field_help}"
-    if is_dict(field_type):  # pylint: disable=no-else-raise
+    if kind == "dict":  # pylint: disable=no-else-raise
         # NOTE: accept any string in json format as input to dict field.
         parser.add_argument(
             f"--{arg_prefix}",
@@ -495,7 +1010,7 @@ def _init_argparse(
             default=json.dumps(field_default) if field_default else None,
             type=json.loads,
         )
-    elif is_list(field_type):
+    elif kind == "list":
         # TODO: We need a more clear help msg for lists.
         if hasattr(field_type, "__args__"):  # if the list is hinted
             if len(field_type.__args__) > 1 and not relaxed_parser:
@@ -534,23 +1049,17 @@ def _init_argparse(
                     arg_prefix=f"{arg_prefix}",
                     relaxed_parser=relaxed_parser,
                 )
-    elif is_union(field_type):
+    elif kind == "union":
         # TODO: currently I don't know how to handle Union type on argparse
         if not relaxed_parser:
             raise NotImplementedError(
                 " [!] Parsing `Union` field from argparse is not yet implemented. Please create an issue."
             )
-    elif issubclass(field_type, Serializable):
+    elif kind == "serializable":
         return default.init_argparse(
             parser, arg_prefix=arg_prefix, help_prefix=help_prefix, relaxed_parser=relaxed_parser
         )
-    elif isinstance(field_type(), bool):
-
-        def parse_bool(x):
-            if x not in ("true", "false"):
-                raise ValueError(f' [!] Value for boolean field must be either "true" or "false". Got "{x}".')
-            return x == "true"
-
+    elif field_type is bool:
         parser.add_argument(
             f"--{arg_prefix}",
             type=parse_bool,
@@ -558,7 +1067,7 @@ def _init_argparse(
             help=f"Coqpit Field: {help_prefix}",
             metavar="true/false",
         )
-    elif is_primitive_type(field_type):
+    elif kind == "primitive":
         parser.add_argument(
             f"--{arg_prefix}",
             default=field_default,
@@ -584,12 +1093,13 @@ class Coqpit(Serializable, MutableMapping):
     Note that it does not support all datatypes and likely to fail in some cases.
     """
 
-    _initialized = False
+    # the internal state has a slot so that the subclasses with `__slots__` (see `add_slots()`) need no `__dict__`
+    __slots__ = ("_initialized",)
 
     def _is_initialized(self):
         """Check if Coqpit is initialized. Useful to prevent running some aux functions
         at the initialization when no attribute has been defined."""
-        return "_initialized" in vars(self) and self._initialized
+        return getattr(self, "_initialized", False)
 
     def __post_init__(self):
         self._initialized = True
@@ -601,17 +1111,17 @@ class Coqpit(Serializable, MutableMapping):
     ## `dict` API functions
 
     def __iter__(self):
-        return iter(asdict(self))
+        return iter(_ordered_field_names(type(self)))
 
     def __len__(self):
-        return len(fields(self))
+        return len(_cached_fields(type(self)))
 
     def __setitem__(self, arg: str, value: Any):
         setattr(self, arg, value)
 
     def __getitem__(self, arg: str):
         """Access class attributes with ``[arg]``."""
-        return self.__dict__[arg]
+        return _instance_var(self, arg)
 
     def __delitem__(self, arg: str):
         delattr(self, arg)
@@ -624,20 +1134,18 @@ class Coqpit(Serializable, MutableMapping):
     def __getattribute__(self, arg: str):  # pylint: disable=no-self-use
         """Check if the mandatory field is defined when accessing it."""
         value = super().__getattribute__(arg)
-        if isinstance(value, str) and value == "???":
+        if isinstance(value, str) and value == MISSING:
             raise AttributeError(f" [!] MISSING field {arg} must be defined.")
         return value
 
     def __contains__(self, arg: str):
-        return arg in self.to_dict()
+        return arg in _cached_field_names(type(self))
 
     def get(self, key: str, default: Any = None):
-        if self.has(key):
-            return asdict(self)[key]
-        return default
-
-    def items(self):
-        return asdict(self).items()
+        try:
+            return _instance_var(self, key)
+        except KeyError:
+            return default
 
     def merge(self, coqpits: Union["Coqpit", List["Coqpit"]]):
         """Merge a coqpit instance or a list of coqpit instances to self.
@@ -659,12 +1167,18 @@ class Coqpit(Serializable, MutableMapping):
                 _merge(coqpit)
         else:
             _merge(coqpits)
+        # `__dataclass_fields__` is updated in place, so the cached fields of the class are stale now.
+        _clear_field_caches(type(self))
 
     def check_values(self):
         pass
 
     def has(self, arg: str) -> bool:
-        return arg in vars(self)
+        try:
+            _instance_var(self, arg)
+        except KeyError:
+            return False
+        return True
 
     def copy(self):
         return replace(self)
@@ -676,18 +1190,17 @@ class Coqpit(Serializable, MutableMapping):
             new (dict): dictionary with new values.
             allow_new (bool, optional): allow new fields to add. Defaults to False.
         """
+        field_names = _cached_field_names(type(self))
         for key, value in new.items():
-            if allow_new:
+            # the field names are checked first, `hasattr()` also accepts the other attributes of the config
+            if allow_new or key in field_names or hasattr(self, key):
                 setattr(self, key, value)
             else:
-                if hasattr(self, key):
-                    setattr(self, key, value)
-                else:
-                    raise KeyError(f" [!] No key - {key}")
+                raise KeyError(f" [!] No key - {key}")
 
     def pprint(self) -> None:
         """Print Coqpit fields in a format."""
-        pprint(asdict(self))
+        pprint(_shallow_asdict(self))
 
     def to_dict(self) -> dict:
         # return asdict(self)
@@ -700,32 +1213,78 @@ class Coqpit(Serializable, MutableMapping):
     def new_from_dict(cls: Serializable, data: dict) -> "Coqpit":
         return cls.deserialize_immutable(data)
 
+    @classmethod
+    def construct(cls, **kwargs) -> "Coqpit":
+        """Create a new Coqpit instance without running ```__init__()```, ```__post_init__()``` and
+        ```check_values()```. Useful to create a placeholder that is filled and validated later, e.g. by
+        ```load_json()```.
+
+        The given values are not validated, converted or copied. ```check_values()``` and the field contracts only
+        run when called explicitly or by ```load_json()```. The internal flags set by ```__post_init__()``` are set
+        the same way, so the instance behaves as one created by ```__init__()``` otherwise.
+
+        Args:
+            **kwargs: field values. The fields not given are set to their default values or to ```MISSING``` if they
+                have no default.
+
+        Raises:
+            TypeError: an unknown field name is given.
+
+        Returns:
+            Coqpit: new Coqpit instance.
+        """
+        unknown = kwargs.keys() - _cached_field_names(cls)
+        if unknown:
+            raise TypeError(f" [!] {cls.__name__} has no fields {sorted(unknown)}.")
+        self = cls.__new__(cls)
+        for f in _cached_fields(cls):
+            if f.name in kwargs:
+                value = kwargs[f.name]
+            elif f.default is not _MISSING:
+                value = f.default
+            elif f.default_factory is not _MISSING:
+                value = f.default_factory()
+            else:
+                value = MISSING
+            object.__setattr__(self, f.name, value)
+        object.__setattr__(self, "_initialized", True)
+        return self
+
     def to_json(self) -> str:
         """Returns a JSON string representation."""
-        return json.dumps(asdict(self), indent=4, default=_coqpit_json_default)
+        return json.dumps(self, indent=4, default=_coqpit_json_default)
 
-    def save_json(self, file_name: str) -> None:
+    def save_json(self, file_name: Union[str, os.PathLike, IO[str]]) -> None:
         """Save Coqpit to a json file.
 
         Args:
-            file_name (str): path to the output json file.
+            file_name (Union[str, os.PathLike, IO[str]]): path to the output json file or a file object opened in
+                text mode.
         """
+        # `json.dump()` writes the output in many small chunks, so encode it at once and write it in one call.
+        json_str = self.to_json()
+        if hasattr(file_name, "write"):
+            file_name.write(json_str)
+            return
         with open(file_name, "w", encoding="utf8") as f:
-            json.dump(asdict(self), f, indent=4)
+            f.write(json_str)
 
-    def load_json(self, file_name: str) -> None:
+    def load_json(self, file_name: Union[str, os.PathLike, IO[str]]) -> None:
         """Load a json file and update matching config fields with type checking.
         Non-matching parameters in the json file are ignored.
 
         Args:
-            file_name (str): path to the json file.
+            file_name (Union[str, os.PathLike, IO[str]]): path to the json file or a file object opened in text mode.
 
         Returns:
             Coqpit: new Coqpit with updated config fields.
         """
-        with open(file_name, "r", encoding="utf8") as f:
-            input_str = f.read()
-            dump_dict = json.loads(input_str)
+        if hasattr(file_name, "read"):
+            input_str = file_name.read()
+        else:
+            with open(file_name, "r", encoding="utf8") as f:
+                input_str = f.read()
+        dump_dict = _json_loads(input_str)
         # TODO: this looks stupid 💆
         self = self.deserialize(dump_dict)  # pylint: disable=self-cls-assignment
         self.check_values()
@@ -753,27 +1312,19 @@ class Coqpit(Serializable, MutableMapping):
         # directly (eg. --coqpit.list.0.val_a 1), by constructing real objects
         # from defaults and passing those to `cls.__init__`
         args_with_lists_processed = {}
-        class_fields = fields(cls)
-        for field in class_fields:
-            has_default = False
-            default = None
-            field_default = field.default if field.default is not _MISSING else None
-            field_default_factory = field.default_factory if field.default_factory is not _MISSING else None
-            if field_default:
-                has_default = True
-                default = field_default
-            elif field_default_factory:
-                has_default = True
-                default = field_default_factory()
-
-            if has_default and (not is_primitive_type(field.type) or is_list(field.type)):
-                args_with_lists_processed[field.name] = default
+        for field_name, field_type, field_default, field_default_factory, _ in _argparse_fields(cls):
+            if not is_primitive_type(field_type) or is_list(field_type):
+                if field_default:
+                    args_with_lists_processed[field_name] = field_default
+                elif field_default_factory is not _MISSING:
+                    args_with_lists_processed[field_name] = field_default_factory()
 
         args_dict = vars(args)
+        prefix = f"{arg_prefix}."
         for k, v in args_dict.items():
             # Remove argparse prefix (eg. "--coqpit." if present)
-            if k.startswith(f"{arg_prefix}."):
-                k = k[len(f"{arg_prefix}.") :]
+            if k.startswith(prefix):
+                k = k[len(prefix) :]
 
             rsetitem(args_with_lists_processed, k, v)
 
@@ -798,16 +1349,19 @@ class Coqpit(Serializable, MutableMapping):
             args = parser.parse_args(args)
 
         args_dict = vars(args)
+        prefix = f"{arg_prefix}."
 
         for k, v in args_dict.items():
-            if k.startswith(f"{arg_prefix}."):
-                k = k[len(f"{arg_prefix}.") :]
+            if k.startswith(prefix):
+                k = k[len(prefix) :]
+            # resolve the parent once and check the target exists before overriding it
+            *names, post = _split_path(k)
             try:
-                rgetattr(self, k)
+                obj = _walk_path(self, names)
+                _walk_path(obj, (post,))
             except (TypeError, AttributeError) as e:
                 raise Exception(f" [!] '{k}' not exist to override from argparse.") from e
-
-            rsetattr(self, k, v)
+            _set_path_item(obj, post, v)
 
         self.check_values()
 
@@ -860,21 +1414,23 @@ class Coqpit(Serializable, MutableMapping):
         """
         if not parser:
             parser = argparse.ArgumentParser()
-        class_fields = fields(self)
-        for field in class_fields:
-            if field.name in vars(self):
+        if isinstance(self, type):
+            # called on the class (e.g. by `init_from_argparse()`), only the field defaults are available. The class
+            # `__dict__` holds the slot descriptors instead of the defaults on slotted classes.
+            cls, instance_vars = self, {}
+        else:
+            cls, instance_vars = type(self), _instance_vars(self)
+        for field_name, field_type, default, field_default_factory, field_help in _argparse_fields(cls):
+            if field_name in instance_vars:
                 # use the current value of the field
                 # prevent dropping the current value
-                field_default = vars(self)[field.name]
+                field_default = instance_vars[field_name]
             else:
                 # use the default value of the field
-                field_default = field.default if field.default is not _MISSING else None
-            field_type = field.type
-            field_default_factory = field.default_factory
-            field_help = _get_help(field)
+                field_default = default
             _init_argparse(
                 parser,
-                field.name,
+                field_name,
                 field_type,
                 field_default,
                 field_default_factory,
@@ -886,12 +1442,79 @@ class Coqpit(Serializable, MutableMapping):
         return parser
 
 
+def add_slots(cls: Type) -> Type:
+    """Rebuild the input dataclass with `__slots__` for its fields. Slotted instances have no `__dict__`, which cuts
+    their memory footprint and speeds up the attribute access. In return, no attributes can be set on the instances
+    other than the fields and `merge()` is not supported.
+
+    It is to be applied on top of `@dataclass`. On Python 3.10+ `@dataclass(slots=True)` can be used instead.
+
+    Args:
+        cls (type): dataclass to add slots to.
+
+    Raises:
+        TypeError: if the class already defines `__slots__`.
+
+    Returns:
+        type: new class with `__slots__`.
+
+    Example:
+        >>> @add_slots
+        >>> @dataclass
+        >>> class Person(Coqpit):
+        >>>     name: str = None
+        >>>     age: int = None
+    """
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f" [!] {cls.__name__} already specifies __slots__")
+    cls_dict = dict(cls.__dict__)
+    inherited_slots = _cached_slot_names(cls)
+    slot_names = [f.name for f in fields(cls)]
+    cls_dict["__slots__"] = tuple(name for name in slot_names if name not in inherited_slots)
+    for name in cls_dict["__slots__"]:
+        # class level default values conflict with the slots of the same name. Defaults are kept by `__init__`.
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict.pop(_CLASS_CACHE_ATTR, None)
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    # zero argument `super()` calls in the methods refer to the class through a `__class__` closure cell
+    for member in new_cls.__dict__.values():
+        if isinstance(member, (classmethod, staticmethod)):
+            member = member.__func__
+        if isinstance(member, property):
+            funcs = (member.fget, member.fset, member.fdel)
+        else:
+            funcs = (member,)
+        for func in funcs:
+            _update_class_cell(func, cls, new_cls)
+    return new_cls
+
+
+def _update_class_cell(func: Any, old_cls: Type, new_cls: Type) -> None:
+    """Point the `__class__` closure cell of the input function from the old class to the new one, as
+    `dataclasses._add_slots()` does. Otherwise zero argument `super()` fails in the methods of the rebuilt class.
+
+    Args:
+        func (Any): class member. Anything but a function is ignored.
+        old_cls (Type): class the cell refers to.
+        new_cls (Type): class to refer to instead.
+    """
+    func = inspect.unwrap(func) if callable(func) else func
+    if not isinstance(func, FunctionType) or "__class__" not in func.__code__.co_freevars:
+        return
+    cell = func.__closure__[func.__code__.co_freevars.index("__class__")]
+    if cell.cell_contents is old_cls:
+        cell.cell_contents = new_cls
+
+
 def check_argument(
     name,
     c,
     is_path: bool = False,
     prerequest: str = None,
-    enum_list: list = None,
+    enum_list: Union[list, set, frozenset] = None,
     max_val: float = None,
     min_val: float = None,
     restricted: bool = False,
@@ -903,52 +1526,80 @@ def check_argument(
 
     Args:
         name (str): name of the field to be checked.
-        c (dict): config dictionary.
+        c (Union[dict, Coqpit]): config dictionary or the config instance itself. Passing the instance avoids
+            creating a copy of the config by ```asdict()``` for each check.
         is_path (bool, optional): if ```True``` check if the path is exist. Defaults to False.
         prerequest (list or str, optional): a list of field name that are prerequestedby the target field name.
             Defaults to ```[]```.
-        enum_list (list, optional): list of possible values for the target field. Defaults to None.
+        enum_list (list or set, optional): possible values for the target field. Pass a ```set``` or ```frozenset```
+            built once (e.g. a module level constant) for constant time lookups with long lists. Defaults to None.
         max_val (float, optional): maximum possible value for the target field. Defaults to None.
         min_val (float, optional): minimum possible value for the target field. Defaults to None.
         restricted (bool, optional): if ```True``` the target field has to be defined. Defaults to False.
         alternative (str, optional): a field name superceding the target field. Defaults to None.
-        allow_none (bool, optional): if ```True``` allow the target field to be ```None```. Defaults to False.
+        allow_none (bool, optional): if ```True``` allow the target field to be ```None```. Defaults to True.
 
 
     Example:
         >>> num_mels = 5
-        >>> check_argument('num_mels', c, restricted=True, min_val=10, max_val=2056)
+        >>> check_argument('num_mels', self, restricted=True, min_val=10, max_val=2056)
         >>> fft_size = 128
-        >>> check_argument('fft_size', c, restricted=True, min_val=128, max_val=4058)
+        >>> check_argument('fft_size', self, restricted=True, min_val=128, max_val=4058)
     """
+    if is_dataclass(c) and not isinstance(c, type):
+        # read the field values of the instance directly
+        c = _instance_vars(c)
+    value = c.get(name, _MISSING)
+    if isinstance(value, str) and value == MISSING:
+        # same as reading the MISSING field of the instance, `__post_init__()` defers the checks until it is defined
+        raise AttributeError(f" [!] MISSING field {name} must be defined.")
+    # check if restricted and it it is check if it exists
+    if value is _MISSING:
+        assert not restricted, f" [!] {name} not defined in config.json"
+        return
     # check if None allowed
-    if allow_none and c[name] is None:
+    if value is None:
+        assert allow_none, f" [!] None value is not allowed for {name}."
         return
-    if not allow_none:
-        assert c[name] is not None, f" [!] None value is not allowed for {name}."
-    # check if restricted and it it is check if it exists
-    if isinstance(restricted, bool) and restricted:
-        assert name in c.keys(), f" [!] {name} not defined in config.json"
     # check prerequest fields are defined
     if isinstance(prerequest, list):
-        assert any(
-            f not in c.keys() for f in prerequest
-        ), f" [!] prequested fields {prerequest} for {name} are not defined."
+        assert any(f not in c for f in prerequest), f" [!] prequested fields {prerequest} for {name} are not defined."
     else:
-        assert (
-            prerequest is None or prerequest in c.keys()
-        ), f" [!] prequested fields {prerequest} for {name} are not defined."
+        assert prerequest is None or prerequest in c, f" [!] prequested fields {prerequest} for {name} are not defined."
     # check if the path exists
     if is_path:
-        assert os.path.exists(c[name]), f' [!] path for {name} ("{c[name]}") does not exist.'
+        assert os.path.exists(value), f' [!] path for {name} ("{value}") does not exist.'
     # skip the rest if the alternative field is defined.
-    if alternative in c.keys() and c[alternative] is not None:
+    if alternative in c and c[alternative] is not None:
         return
     # check value constraints
-    if name in c.keys():
-        if max_val is not None:
-            assert c[name] <= max_val, f" [!] {name} is larger than max value {max_val}"
-        if min_val is not None:
-            assert c[name] >= min_val, f" [!] {name} is smaller than min value {min_val}"
-        if enum_list is not None:
-            assert c[name].lower() in enum_list, f" [!] {name} is not a valid value"
+    if max_val is not None:
+        assert value <= max_val, f" [!] {name} is larger than max value {max_val}"
+    if min_val is not None:
+        assert value >= min_val, f" [!] {name} is smaller than min value {min_val}"
+    if enum_list is not None:
+        assert value.lower() in enum_list, f" [!] {name} is not a valid value"
+
+
+def check_arguments(specs: List[Dict[str, Any]], c) -> None:
+    """Run ```check_argument()``` for a batch of fields. The config instance is converted to a mapping once for all
+    the checks instead of once per check.
+
+    Args:
+        specs (List[Dict[str, Any]]): keyword arguments of ```check_argument()``` for each field, including the field
+            ```name```.
+        c (Union[dict, Coqpit]): config dictionary or the config instance itself.
+
+    Example:
+        >>> check_arguments(
+        ...     [
+        ...         {"name": "num_mels", "restricted": True, "min_val": 10, "max_val": 2056},
+        ...         {"name": "fft_size", "restricted": True, "min_val": 128, "max_val": 4058},
+        ...     ],
+        ...     self,
+        ... )
+    """
+    if is_dataclass(c) and not isinstance(c, type):
+        c = _instance_vars(c)
+    for spec in specs:
+        check_argument(c=c, **spec)
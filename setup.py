@@ -20,8 +20,14 @@ class build_py(setuptools.command.build_py.build_py):  # pylint: disable=too-man
     def create_version_file():
         print("-- Building version " + version)
         version_path = os.path.join(cwd, "version.py")
+        content = "__version__ = '{}'\n".format(version)
+        if os.path.exists(version_path):
+            with open(version_path) as f:
+                if f.read() == content:
+                    # keep the file and its mtime so that the unchanged build steps are not rerun
+                    return
         with open(version_path, "w") as f:
-            f.write("__version__ = '{}'\n".format(version))
+            f.write(content)
 
 
 class develop(setuptools.command.develop.develop):
@@ -57,6 +63,10 @@ setup(
         "develop": develop,
     },
     install_requires=requirements,
+    extras_require={
+        # faster json parsing in `load_json()`
+        "fast": ["orjson"],
+    },
     python_requires=">=3.7.0",
     classifiers=[
         "Programming Language :: Python",
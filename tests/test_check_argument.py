@@ -0,0 +1,100 @@
+from dataclasses import asdict, dataclass
+
+from coqpit.coqpit import MISSING, Coqpit, check_argument, check_arguments
+
+
+@dataclass
+class SimpleConfig(Coqpit):
+    val_a: int = 10
+    val_b: int = None
+    val_c: str = "Coqpit is great!"
+
+
+def test_check_argument():
+    config = SimpleConfig()
+
+    # both the instance and its dict representation are accepted
+    for c in (config, asdict(config)):
+        check_argument("val_a", c, restricted=True, min_val=10, max_val=2056)
+        check_argument("val_b", c, restricted=True, min_val=128, max_val=4058, allow_none=True)
+        check_argument("val_c", c, restricted=True)
+
+    config.val_a = 5
+    try:
+        check_argument("val_a", config, restricted=True, min_val=10, max_val=2056)
+        assert False, "check_argument() should fail for a value smaller than `min_val`."
+    except AssertionError as e:
+        assert "smaller than min value" in e.args[0]
+
+    # undefined fields fail only if they are restricted
+    check_argument("val_does_not_exist", config)
+    try:
+        check_argument("val_does_not_exist", config, restricted=True)
+        assert False, "check_argument() should fail for an undefined restricted field."
+    except AssertionError as e:
+        assert "not defined" in e.args[0]
+
+    config.val_b = None
+    try:
+        check_argument("val_b", config, allow_none=False)
+        assert False, "check_argument() should fail for None when `allow_none` is False."
+    except AssertionError as e:
+        assert "None value is not allowed" in e.args[0]
+
+
+def test_check_argument_enum():
+    config = SimpleConfig(val_c="Adam")
+
+    # values are lowercased before the lookup, `enum_list` can be a list or a set
+    check_argument("val_c", config, enum_list=["adam", "sgd"])
+    check_argument("val_c", config, enum_list=frozenset({"adam", "sgd"}))
+    try:
+        check_argument("val_c", config, enum_list=frozenset({"sgd"}))
+        assert False, "check_argument() should fail for a value not in `enum_list`."
+    except AssertionError as e:
+        assert "not a valid value" in e.args[0]
+
+
+def test_check_arguments():
+    config = SimpleConfig()
+
+    check_arguments(
+        [
+            {"name": "val_a", "restricted": True, "min_val": 10, "max_val": 2056},
+            {"name": "val_b", "restricted": True, "min_val": 128, "max_val": 4058, "allow_none": True},
+            {"name": "val_c", "restricted": True},
+        ],
+        config,
+    )
+
+    try:
+        check_arguments([{"name": "val_c"}, {"name": "val_a", "max_val": 5}], config)
+        assert False, "check_arguments() should fail for a value larger than `max_val`."
+    except AssertionError as e:
+        assert "larger than max value" in e.args[0]
+
+
+def test_check_argument_missing():
+    @dataclass
+    class MissingConfig(Coqpit):
+        val_a: int = MISSING
+
+        def check_values(self):
+            check_argument("val_a", self, restricted=True, min_val=0, max_val=10)
+
+    # the checks are deferred until the MISSING field is defined
+    config = MissingConfig()
+    try:
+        check_argument("val_a", config, restricted=True, min_val=0, max_val=10)
+        assert False, "MISSING fields should raise AttributeError."
+    except AttributeError:
+        pass
+
+    config.val_a = 5
+    config.check_values()
+    config.val_a = 20
+    try:
+        config.check_values()
+        assert False, "val_a is larger than max_val."
+    except AssertionError as e:
+        assert "larger than max value" in str(e)
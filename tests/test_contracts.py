@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from coqpit.coqpit import Serializable
+
+
+@dataclass
+class Model(Serializable):
+    name: str = "model"
+    num_layers: int = field(default=2, metadata={"contract": lambda x: x > 0})
+    checkpoint: Optional[str] = None
+
+
+def test_contracts():
+    Model()
+    Model(checkpoint="model.pth")
+
+    try:
+        Model(num_layers=0)
+        assert False, "contract violation should raise ValueError."
+    except ValueError:
+        pass
+
+    try:
+        Model(name=None)
+        assert False, "None value for a non-optional field should raise TypeError."
+    except TypeError:
+        pass
+
+
+def test_validate():
+    Model(num_layers=4, checkpoint="model.pth").validate()
+
+    model = Model()
+    model.num_layers = -1
+    try:
+        model.validate()
+        assert False, "validate() should check the contracts."
+    except ValueError:
+        pass
+
+
+@dataclass
+class WithDict(Serializable):
+    value: dict = None
+
+
+def test_validate_json_serializable():
+    WithDict(value={"a": [1, 2.5, None]}).validate()
+
+    try:
+        WithDict(value={"a": {1, 2}}).validate()
+        assert False, "validate() should fail for values that cannot be encoded to json."
+    except TypeError:
+        pass
+
+
+def test_validate_json_round_trip():
+    # json turns the keys into str and the tuples into lists, so the values are not loaded back the same
+    for value in ({1: "x"}, {"a": (1, 2)}):
+        try:
+            WithDict(value=value).validate()
+            assert False, f"validate() should fail for {value}."
+        except ValueError:
+            pass
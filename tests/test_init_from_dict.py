@@ -1,5 +1,6 @@
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Union
 
 from coqpit import Coqpit
 
@@ -47,3 +48,44 @@ def test_new_from_dict():
         WithRequired.new_from_dict({})
     except ValueError as e:
         assert "Missing required field" in e.args[0]
+
+
+@dataclass
+class WithPrimitiveLists(Coqpit):
+    float_list: List[float] = field(default_factory=lambda: [0.5])
+    int_list: List[int] = field(default_factory=lambda: [1])
+
+
+def test_new_from_dict_primitive_lists():
+    config = WithPrimitiveLists.new_from_dict(
+        {"float_list": [1, 2.5, float("inf")], "int_list": [1.0, 2, float("inf")]}
+    )
+
+    assert config.float_list == [1.0, 2.5, float("inf")]
+    assert all(isinstance(v, float) for v in config.float_list)
+    assert config.int_list == [1, 2, float("inf")]
+    assert isinstance(config.int_list[0], int)
+
+
+@dataclass
+class WithUnions(Coqpit):
+    list_or_int: Union[List[int], int] = None
+    int_or_list: Union[int, List[int]] = None
+    people_or_person: Union[List[Person], Person] = None
+
+
+def test_new_from_dict_unions():
+    config = WithUnions.new_from_dict(
+        {"list_or_int": 5, "int_or_list": [1, 2], "people_or_person": {"name": "Eren", "age": 11}}
+    )
+
+    assert config.list_or_int == 5
+    assert config.int_or_list == [1, 2]
+    assert config.people_or_person == Person(name="Eren", age=11)
+
+    config = WithUnions.new_from_dict({"people_or_person": [{"name": "Eren", "age": 11}]})
+    assert config.people_or_person == [Person(name="Eren", age=11)]
+
+    # subclasses of the accepted value types are decoded too
+    config = WithUnions.new_from_dict({"people_or_person": OrderedDict(name="Eren", age=11)})
+    assert config.people_or_person == Person(name="Eren", age=11)
@@ -45,3 +45,27 @@ def test_config_merge():
     assert coqpit_ref.val_f == coqpitb.val_f
     assert coqpit_ref.val_g == coqpitb.val_g
     assert coqpit_ref.val_same == coqpitb.val_same
+
+
+def test_config_merge_field_caches():
+    @dataclass
+    class Base(Coqpit):
+        val_a: int = 1
+
+    @dataclass
+    class Child(Base):
+        val_b: int = 2
+
+    @dataclass
+    class Other(Coqpit):
+        val_e: int = 257
+
+    base, child, other = Base(), Child(), CoqpitA()
+    for config in (base, child, other):
+        config.to_dict()
+    base.merge(Other())
+    # only the caches of the merged class and its subclasses are dropped
+    assert not Base.__dict__["__coqpit_cache__"]
+    assert not Child.__dict__["__coqpit_cache__"]
+    assert CoqpitA.__dict__["__coqpit_cache__"]
+    assert base.to_dict()["val_e"] == 257
@@ -1,5 +1,5 @@
 import os
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import List, Union
 
 from coqpit import Coqpit, check_argument
@@ -15,7 +15,7 @@ class SimpleConfig(Coqpit):
         self,
     ):
         """Check config fields"""
-        c = asdict(self)
+        c = self
         check_argument("val_a", c, restricted=True, min_val=10, max_val=2056)
         check_argument("val_b", c, restricted=True, min_val=128, max_val=4058, allow_none=True)
         check_argument("val_c", c, restricted=True)
@@ -34,7 +34,7 @@ class NestedConfig(Coqpit):
         self,
     ):
         """Check config fields"""
-        c = asdict(self)
+        c = self
         check_argument("val_d", c, restricted=True, min_val=10, max_val=2056)
         check_argument("val_e", c, restricted=True, min_val=128, max_val=4058, allow_none=True)
         check_argument("val_f", c, restricted=True)
@@ -42,8 +42,8 @@ class NestedConfig(Coqpit):
         check_argument("sc", c, restricted=True, allow_none=True)
 
 
-def test_nested():
-    file_path = os.path.dirname(os.path.abspath(__file__))
+def test_nested(tmp_path):
+    file_path = tmp_path
     # init 🐸 dataclass
     config = NestedConfig()
 
@@ -1,4 +1,5 @@
-from dataclasses import asdict, dataclass, field
+import argparse
+from dataclasses import dataclass, field
 from typing import List
 
 from coqpit.coqpit import Coqpit, check_argument
@@ -33,7 +34,7 @@ class SimpleConfig(Coqpit):
         self,
     ):
         """Check config fields"""
-        c = asdict(self)
+        c = self
         check_argument("val_a", c, restricted=True, min_val=10, max_val=2056)
         check_argument("val_b", c, restricted=True, min_val=128, max_val=4058, allow_none=True)
         check_argument("val_c", c, restricted=True)
@@ -160,7 +161,7 @@ def test_init_argparse_list_and_nested():
             self,
         ):
             """Check config fields"""
-            c = asdict(self)
+            c = self
             check_argument("val_a", c, restricted=True, min_val=10, max_val=2056)
             check_argument("val_b", c, restricted=True, min_val=128, max_val=4058, allow_none=True)
             check_argument("val_req", c, restricted=True)
@@ -194,3 +195,25 @@ def test_init_argparse_list_and_nested():
 
     # check the parsed config with the reference config
     assert parsed == config_ref
+
+
+def test_init_argparse_list_of_primitives():
+    @dataclass
+    class SimpleConfig3(Coqpit):
+        int_list: List[int] = field(default_factory=lambda: [1, 2, 3], metadata={"help": "int"})
+        str_list: List[str] = field(default_factory=lambda: ["veni", "vidi", "vici"], metadata={"help": "str"})
+
+    args = ["--coqpit.int_list.1", "4", "--coqpit.str_list.0", "neci"]
+    parsed = SimpleConfig3.init_from_argparse(args)
+
+    assert parsed == SimpleConfig3(int_list=[1, 4, 3], str_list=["neci", "vidi", "vici"])
+
+
+def test_parse_args_unknown_field():
+    config = SimpleConfig()
+    args = argparse.Namespace(**{"coqpit.val_a": 20, "coqpit.int_list.0": 5, "coqpit.val_does_not_exist": 1})
+    try:
+        config.parse_args(args)
+        assert False, "parse_args() should raise for unknown fields."
+    except Exception as e:  # pylint: disable=broad-except
+        assert "val_does_not_exist" in str(e)
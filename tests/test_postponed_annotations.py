@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from coqpit import Coqpit
+from coqpit.coqpit import Serializable
+
+
+@dataclass
+class Person(Coqpit):
+    name: str = None
+    age: int = None
+
+
+@dataclass
+class Group(Coqpit):
+    name: str = None
+    people: List[Person] = field(default_factory=lambda: [Person(name="Eren", age=11)])
+
+
+@dataclass
+class Checkpoint(Serializable):
+    path: str = "model.pth"
+    step: Optional[int] = None
+
+
+def test_postponed_annotations():
+    config = Group.new_from_dict({"name": "Coqpit", "people": [{"name": "Geren", "age": 12.0}]})
+
+    assert config == Group(name="Coqpit", people=[Person(name="Geren", age=12)])
+    assert isinstance(config.people[0].age, int)
+
+
+def test_postponed_annotations_argparse():
+    args = ["--coqpit.name", "Coqpit", "--coqpit.people.0.age", "12"]
+    config = Group.init_from_argparse(args)
+
+    assert config == Group(name="Coqpit", people=[Person(name="Eren", age=12)])
+
+
+def test_postponed_annotations_optional():
+    checkpoint = Checkpoint()
+    assert checkpoint.step is None
+    checkpoint.validate()
+
+    try:
+        Checkpoint(path=None)
+        assert False, "None value for a non-optional field should raise TypeError."
+    except TypeError:
+        pass
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import List, Union
 
 from coqpit.coqpit import Coqpit, check_argument
@@ -20,7 +20,7 @@ class SimpleConfig(Coqpit):
         self,
     ):
         """Check config fields"""
-        c = asdict(self)
+        c = self
         check_argument("val_a", c, restricted=True, min_val=10, max_val=2056)
         check_argument("val_b", c, restricted=True, min_val=128, max_val=4058, allow_none=True)
 
@@ -51,3 +51,17 @@ def test_serizalization():
     assert ref_config.people[0].age == new_config.people[0].age
     assert ref_config.people[1].age == new_config.people[1].age
     assert ref_config.people[2].age == new_config.people[2].age
+
+
+def test_serizalization_fileobject(tmp_path):
+    file_path = tmp_path / "test_serialization.json"
+
+    ref_config = Reference()
+    with open(file_path, "w", encoding="utf8") as f:
+        ref_config.save_json(f)
+
+    new_config = Group()
+    with open(file_path, "r", encoding="utf8") as f:
+        new_config.load_json(f)
+
+    assert ref_config.serialize() == new_config.serialize()
@@ -1,5 +1,5 @@
 import os
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Union
 
 from coqpit.coqpit import MISSING, Coqpit, check_argument
@@ -27,14 +27,14 @@ class SimpleConfig(Coqpit):
         self,
     ):  # you can define explicit constraints on the fields using `check_argument()`
         """Check config fields"""
-        c = asdict(self)
+        c = self
         check_argument("val_a", c, restricted=True, min_val=10, max_val=2056)
         check_argument("val_b", c, restricted=True, min_val=128, max_val=4058, allow_none=True)
         check_argument("val_c", c, restricted=True)
 
 
-def test_simple_config():
-    file_path = os.path.dirname(os.path.abspath(__file__))
+def test_simple_config(tmp_path):
+    file_path = tmp_path
     config = SimpleConfig()
 
     # try MISSING class argument
@@ -60,3 +60,75 @@ def test_simple_config():
     config["val_a"] = -999
     print(config["val_a"])
     assert config.val_a == -999
+
+
+def test_dict_interface():
+    config = SimpleConfig(val_k=1000)
+
+    assert list(config) == [field.name for field in fields(config)]
+    assert "val_a" in config
+    assert "val_does_not_exist" not in config
+    assert config.get("val_a") == 10
+    assert config.get("val_does_not_exist", -1) == -1
+    assert dict(config.items()) == {name: getattr(config, name) for name in config}
+    assert ("val_a", 10) in config.items()
+    # values are not copied
+    assert config.get("val_dict") is config.val_dict
+    assert list(config.keys()) == list(config)
+    assert "val_a" in config.keys()
+    assert config.keys() & {"val_a", "val_does_not_exist"} == {"val_a"}
+    assert list(config.values()) == [getattr(config, name) for name in config]
+    assert dict(**config) == dict(config.items())
+
+
+def test_construct(tmp_path):
+    file_path = tmp_path / "example_config.json"
+    config = SimpleConfig()
+    config.val_k = 1000
+    config.save_json(file_path)
+
+    # `construct()` skips `check_values()`, so out of range values are accepted until the config is loaded
+    config2 = SimpleConfig.construct(val_a=0)
+    assert config2.val_a == 0
+    assert config2._is_initialized()  # pylint: disable=protected-access
+    assert config2.val_dict == {"val_aa": 10, "val_ss": "This is in a dict."}
+    config2.load_json(file_path)
+    assert config2.val_a == 10
+    assert config2.val_k == 1000
+
+    @dataclass
+    class RequiredConfig(Coqpit):
+        val_req: int
+
+    try:
+        _ = RequiredConfig.construct().val_req
+        assert False, "fields without a default should be MISSING."
+    except AttributeError:
+        pass
+
+    try:
+        SimpleConfig.construct(val_does_not_exist=1)
+        assert False, "construct() should raise TypeError for unknown fields."
+    except TypeError:
+        pass
+
+
+def test_getattribute_mixin():
+    class AliasMixin:
+        def __getattribute__(self, arg):
+            if arg == "val_alias":
+                arg = "val_a"
+            return super().__getattribute__(arg)
+
+    @dataclass
+    class AliasConfig(Coqpit, AliasMixin):
+        val_a: int = 10
+        val_b: int = MISSING
+
+    config = AliasConfig()
+    assert config.val_alias == 10
+    try:
+        _ = config.val_b
+        assert False, "MISSING fields should raise AttributeError."
+    except AttributeError:
+        pass
@@ -0,0 +1,88 @@
+import copy
+from dataclasses import dataclass, field
+from typing import List
+
+from coqpit.coqpit import Coqpit, add_slots, check_argument
+
+
+@add_slots
+@dataclass
+class Person(Coqpit):
+    name: str = None
+    age: int = None
+
+
+@add_slots
+@dataclass
+class Group(Coqpit):
+    name: str = "Coqpit"
+    size: int = 3
+    people: List[Person] = field(default_factory=lambda: [Person(name="Eren", age=11), Person(name="Geren", age=12)])
+
+    def check_values(self):
+        check_argument("size", self, restricted=True, min_val=1)
+
+
+def test_slots(tmp_path):
+    file_path = tmp_path / "example_config.json"
+    config = Group()
+    assert not hasattr(config, "__dict__")
+    assert config["size"] == 3
+    assert config.has("people")
+    assert not config.has("does_not_exist")
+    assert config.get("name") == "Coqpit"
+    assert config.get("does_not_exist", -1) == -1
+
+    config.save_json(file_path)
+    new_config = Group(name=None, size=10, people=[])
+    new_config.load_json(file_path)
+    assert config == new_config
+    assert config == Group.new_from_dict(config.to_dict())
+
+    config_new = copy.deepcopy(config)
+    config_new.people[0].age = 42
+    assert config.people[0].age != config_new.people[0].age
+
+    config.parse_args(["--coqpit.size", "5", "--coqpit.people.1.name", "Ceren"])
+    assert config.size == 5
+    assert config.people[1].name == "Ceren"
+
+
+def test_slots_argparse():
+    config = Group.init_from_argparse(["--coqpit.size", "5", "--coqpit.people.1.name", "Ceren"])
+    assert config.size == 5
+    assert config.people[1].name == "Ceren"
+
+    parser = Group.init_argparse(Group)
+    args = parser.parse_args(["--coqpit.name", "Slots"])
+    assert vars(args)["coqpit.name"] == "Slots"
+    assert vars(args)["coqpit.size"] == 3
+
+
+@add_slots
+@dataclass
+class Adult(Person):
+    def check_values(self):
+        super().check_values()
+        check_argument("age", self, min_val=18)
+
+
+def test_slots_super():
+    config = Adult(name="Eren", age=18)
+    assert not hasattr(config, "__dict__")
+    try:
+        Adult(name="Geren", age=12)
+        assert False, "check_values() should fail for age < 18."
+    except AssertionError as e:
+        assert "smaller than min value" in str(e)
+
+
+def test_slots_base():
+    # the base class has a slot for its internal state
+    config = Coqpit()
+    assert config._is_initialized()  # pylint: disable=protected-access
+    assert len(config) == 0
+
+    config = Person(name="Eren")
+    assert config._is_initialized()  # pylint: disable=protected-access
+    assert copy.deepcopy(config)._is_initialized()  # pylint: disable=protected-access
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+
+from coqpit.coqpit import MISSING, Coqpit
+
+
+@dataclass
+class SimpleConfig(Coqpit):
+    val_a: int = 10
+    val_b: int = MISSING
+    # class attribute, not a field
+    version = 1
+
+
+def test_update():
+    config = SimpleConfig()
+
+    # MISSING fields can be updated too
+    config.update({"val_a": 20, "val_b": 30})
+    assert config.val_a == 20
+    assert config.val_b == 30
+
+    try:
+        config.update({"val_does_not_exist": 1})
+        assert False, "update() should raise KeyError for unknown keys."
+    except KeyError:
+        pass
+
+    # new keys are accepted with `allow_new` and can be updated afterwards
+    config.update({"val_new": 1}, allow_new=True)
+    config.update({"val_new": 2})
+    assert config.val_new == 2
+
+    # attributes other than the fields can be updated too
+    config.update({"version": 2})
+    assert config.version == 2